@@ -1,22 +1,103 @@
+from sqlalchemy import select, insert, bindparam, func, lambda_stmt, literal_column
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects import mysql
 from typing import Optional, List
+from datetime import datetime
+from decouple import config
 from . import models, schemas 
+from .database import engine
+
+# Full-text search needs the FULLTEXT (MySQL) or GIN (PostgreSQL) indexes declared in models.py;
+# when disabled, or on other backends, text filters fall back to substring ILIKE matching
+FULLTEXT_SEARCH = config('FULLTEXT_SEARCH', default=False, cast=bool) and engine.dialect.name in ('mysql', 'postgresql')
+
+# Values of the media_type column in movies_and_shows_mv
+MEDIA_TYPES = ('movie', 'show')
+
+def text_search(column, param_name: str):
+    """
+    Builds a filter condition matching a named bound search term against a text column.
+
+    The statement shape only depends on configuration, so it can be built inside cached
+    lambda statements; bind the value returned by search_value() under param_name.
+
+    Args:
+        column (Column): Text column to search.
+        param_name (str): Name of the bound parameter holding the search term.
+
+    Returns:
+        ColumnElement: Full-text match condition when FULLTEXT_SEARCH is enabled (MySQL natural
+        language mode or PostgreSQL plainto_tsquery, so search operators are not interpreted),
+        case-insensitive substring condition otherwise.
+    """
+    term = bindparam(param_name)
+    if FULLTEXT_SEARCH and engine.dialect.name == 'postgresql':
+        ts_config = literal_column("'simple'")
+        return func.to_tsvector(ts_config, column).op('@@')(func.plainto_tsquery(ts_config, term))
+    if FULLTEXT_SEARCH:
+        # Natural language mode treats + - * " ~ in client input as plain text, unlike boolean mode
+        return mysql.match(column, against=term).in_natural_language_mode()
+    return column.ilike(term)
+
+def search_value(term: str) -> str:
+    """
+    Formats a client search term as the value bound to a text_search() parameter.
+
+    Args:
+        term (str): Search term provided by the client.
+
+    Returns:
+        str: The term itself for full-text search, the term wrapped in wildcards for ILIKE.
+    """
+    return term if FULLTEXT_SEARCH else f"%{term}%"
 
 # Functions related to Movies
 
-def get_movies(db: Session, skip: int = 0, limit: int = 100):
+def get_movies(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[int] = None):
     """
-    Fetches a list of movies from the database.
+    Fetches a page of movies from the database.
+
+    Pages are ordered by the primary key. When a cursor is given, the page starts
+    right after it (keyset pagination), so deep pages cost the same as the first one.
 
     Args:
         db (Session): Database session object.
-        skip (int): Number of records to skip (for pagination).
+        skip (int): Number of records to skip (deprecated OFFSET pagination, ignored when cursor is set).
         limit (int): Maximum number of records to fetch.
+        cursor (int, optional): Index of the last movie on the previous page.
 
     Returns:
-        List[dict]: List of dictionaries representing movie records.
+        dict: Page with the movie records under 'items', whether more follow under 'has_more'
+            and the cursor of the next page under 'next_cursor'.
     """
-    return db.query(models.Movies).offset(skip).limit(limit).all()
+    # Select plain columns (in response order) so rows skip ORM entity hydration
+    query = select(
+        models.Movies.index,
+        models.Movies.movie_id,
+        models.Movies.title,
+        models.Movies.release_year,
+        models.Movies.age_certification,
+        models.Movies.runtime,
+    ).order_by(models.Movies.index)
+    if cursor is not None:
+        query = query.where(models.Movies.index > cursor)
+    else:
+        query = query.offset(skip)
+
+    # Fetch one extra row to tell whether another page follows without a COUNT query
+    rows = db.execute(query.limit(limit + 1)).all()
+    has_more = len(rows) > limit
+
+    # Copy each row mapping once and take the cursor column out of it
+    movies = []
+    last_index = None
+    for row in rows[:limit]:
+        item = dict(row._mapping)
+        last_index = item.pop('index')
+        movies.append(item)
+    next_cursor = last_index if has_more else None
+
+    return {"items": movies, "has_more": has_more, "next_cursor": next_cursor}
 
 def get_movies_by_actors(db: Session, actor_name: str, limit: int = 100):
     """
@@ -30,9 +111,9 @@ def get_movies_by_actors(db: Session, actor_name: str, limit: int = 100):
     Returns:
         List[dict]: List of dictionaries representing movie records with actor information.
     """
-    query = (
-        db.query(
-            models.Movies.index,
+    # Cached lambda statement: built and compiled once, the search term is bound at execution
+    query = lambda_stmt(lambda: (
+        select(
             models.Movies.movie_id,
             models.Movies.title,
             models.Movies.release_year,
@@ -42,22 +123,13 @@ def get_movies_by_actors(db: Session, actor_name: str, limit: int = 100):
         )
         .join(models.ActorsBridge, models.Movies.movie_id == models.ActorsBridge.movie_id)
         .join(models.Actors, models.ActorsBridge.actor_id == models.Actors.actor_id)
-        .filter(models.Actors.actor.ilike(f"%{actor_name}%"))  # Case-insensitive search
-        .limit(limit)
-        .all()
-    )
-
-    movies = [
-        {
-            'movie_id': row.movie_id,
-            'title': row.title,
-            'release_year': row.release_year,
-            'age_certification': row.age_certification,
-            'runtime': row.runtime,
-            'actor': row.actor,
-        }
-        for row in query
-    ]
+        .where(text_search(models.Actors.actor, 'actor_name'))
+        .limit(bindparam('limit'))
+    ))
+    rows = db.execute(query, {'actor_name': search_value(actor_name), 'limit': limit})
+
+    # The selected columns already carry the response keys, copy each row mapping once
+    movies = [dict(row._mapping) for row in rows]
     
     return movies
 
@@ -70,6 +142,8 @@ def get_movie_by_ratings(
     """
     Fetches movies based on ratings criteria.
 
+    Movies without an IMDB score are left out, so only rated movies are ranked.
+
     Args:
         db (Session): Database session object.
         release_year (int, optional): Release year of the movie.
@@ -79,9 +153,12 @@ def get_movie_by_ratings(
     Returns:
         List[dict]: List of dictionaries representing movie records with rating information.
     """
-    query = (
-        db.query(
-            models.Movies.index,
+    params = {'limit': limit}
+
+    # Build the statement from cached lambdas with every value bound by name, so the
+    # compiled SQL is reused across calls that only differ in filter values
+    query = lambda_stmt(lambda: (
+        select(
             models.Movies.movie_id,
             models.Movies.title,
             models.Movies.release_year,
@@ -94,53 +171,75 @@ def get_movie_by_ratings(
         .join(models.GenresBridge, models.Movies.movie_id == models.GenresBridge.movie_id)
         .join(models.Genres, models.GenresBridge.genre_id == models.Genres.genre_id)
         .join(models.IMDBInfo, models.Movies.movie_id == models.IMDBInfo.movie_id)
-    )
+        .where(models.IMDBInfo.imdb_score.isnot(None))
+    ))
 
     # Apply filters based on the provided parameters
     if release_year is not None:
-        query = query.filter(models.Movies.release_year == release_year)
+        query += lambda s: s.where(models.Movies.release_year == bindparam('release_year'))
+        params['release_year'] = release_year
     if genre is not None:
-        query = query.filter(models.Genres.genre.ilike(f"%{genre}%"))
-
-    # Sort by imdb_score in descending order
-    query = query.order_by(desc(models.IMDBInfo.imdb_score))
-
-    results = query.limit(limit).all()  # Fetch paginated results
-
-    # Convert results to dictionary format with rating information
-    movies = [
-        {
-            "movie_id": result.movie_id,
-            "title": result.title,
-            "release_year": result.release_year,
-            "age_certification": result.age_certification,
-            "runtime": result.runtime,
-            "genre": result.genre,
-            "imdb_score": result.imdb_score,
-            "imdb_votes": result.imdb_votes
-        }
-        for result in results
-    ]
+        query += lambda s: s.where(text_search(models.Genres.genre, 'genre'))
+        params['genre'] = search_value(genre)
+
+    # Sort by imdb_score in descending order, matching ix_imdb_info_score_desc so no extra sort is needed
+    query += lambda s: s.order_by(models.IMDBInfo.imdb_score.desc(), models.IMDBInfo.movie_id).limit(bindparam('limit'))
+
+    results = db.execute(query, params).all()  # Fetch paginated results
+
+    # The selected columns already carry the response keys, copy each row mapping once
+    movies = [dict(result._mapping) for result in results]
 
     return movies
 
 # Functions related to Shows
 
-from sqlalchemy import desc
-
-def get_shows(db: Session, skip: int = 0, limit: int = 100):
+def get_shows(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[int] = None):
     """
-    Fetches a list of shows from the database.
+    Fetches a page of shows from the database.
+
+    Pages are ordered by the primary key. When a cursor is given, the page starts
+    right after it (keyset pagination), so deep pages cost the same as the first one.
 
     Args:
         db (Session): Database session object.
-        skip (int): Number of records to skip (for pagination).
+        skip (int): Number of records to skip (deprecated OFFSET pagination, ignored when cursor is set).
         limit (int): Maximum number of records to fetch.
+        cursor (int, optional): Index of the last show on the previous page.
 
     Returns:
-        List[dict]: List of dictionaries representing show records.
+        dict: Page with the show records under 'items', whether more follow under 'has_more'
+            and the cursor of the next page under 'next_cursor'.
     """
-    return db.query(models.Shows).offset(skip).limit(limit).all()
+    # Select plain columns (in response order) so rows skip ORM entity hydration
+    query = select(
+        models.Shows.index,
+        models.Shows.show_id,
+        models.Shows.title,
+        models.Shows.release_year,
+        models.Shows.age_certification,
+        models.Shows.runtime,
+        models.Shows.seasons,
+    ).order_by(models.Shows.index)
+    if cursor is not None:
+        query = query.where(models.Shows.index > cursor)
+    else:
+        query = query.offset(skip)
+
+    # Fetch one extra row to tell whether another page follows without a COUNT query
+    rows = db.execute(query.limit(limit + 1)).all()
+    has_more = len(rows) > limit
+
+    # Copy each row mapping once and take the cursor column out of it
+    shows = []
+    last_index = None
+    for row in rows[:limit]:
+        item = dict(row._mapping)
+        last_index = item.pop('index')
+        shows.append(item)
+    next_cursor = last_index if has_more else None
+
+    return {"items": shows, "has_more": has_more, "next_cursor": next_cursor}
 
 def get_shows_by_details(
     db: Session,
@@ -149,26 +248,37 @@ def get_shows_by_details(
     age_certification: Optional[str] = None,
     genre: Optional[str] = None,
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[int] = None
 ):
     """
     Fetches shows based on detailed criteria.
 
+    Every result row is one show/genre pair, so rows are ordered and paged by the
+    genres_bridge primary key, which is unique per row.
+
     Args:
         db (Session): Database session object.
         title (str, optional): Title of the show.
         release_year (int, optional): Release year of the show.
         age_certification (str, optional): Age certification of the show.
         genre (str, optional): Genre of the show.
-        skip (int): Number of records to skip (for pagination).
+        skip (int): Number of records to skip (deprecated OFFSET pagination, ignored when cursor is set).
         limit (int): Maximum number of records to fetch.
+        cursor (int, optional): Cursor returned with the previous page.
 
     Returns:
-        List[dict]: List of dictionaries representing show records with genre information.
+        dict: Page with show records including genre information under 'items', whether more follow
+            under 'has_more' and the cursor of the next page under 'next_cursor'.
     """
-    query = (
-        db.query(
-            models.Shows.index,
+    # One extra row is fetched to tell whether another page follows without a COUNT query
+    params = {'skip': skip, 'limit': limit + 1}
+
+    # Build the statement from cached lambdas: SQLAlchemy keys the construction and compiled SQL
+    # on the lambdas' code, so each filter combination is only built once and values are bound by name
+    query = lambda_stmt(lambda: (
+        select(
+            models.GenresBridge.index.label('bridge_index'),
             models.Shows.show_id,
             models.Shows.title,
             models.Shows.release_year,
@@ -179,35 +289,43 @@ def get_shows_by_details(
         )
         .join(models.GenresBridge, models.Shows.show_id == models.GenresBridge.show_id)
         .join(models.Genres, models.GenresBridge.genre_id == models.Genres.genre_id)
-    )
+    ))
 
     # Apply filters based on the provided parameters
     if title is not None:
-        query = query.filter(models.Shows.title.ilike(f"%{title}%"))
+        query += lambda s: s.where(text_search(models.Shows.title, 'title'))
+        params['title'] = search_value(title)
     if release_year is not None:
-        query = query.filter(models.Shows.release_year == release_year)
+        query += lambda s: s.where(models.Shows.release_year == bindparam('release_year'))
+        params['release_year'] = release_year
     if age_certification is not None:
-        query = query.filter(models.Shows.age_certification == age_certification)
+        query += lambda s: s.where(models.Shows.age_certification == bindparam('age_certification'))
+        params['age_certification'] = age_certification
     if genre is not None:
-        query = query.filter(models.Genres.genre.ilike(f"%{genre}%"))
-
-    results = query.offset(skip).limit(limit).all()  # Fetch paginated results
-
-    # Convert results to dictionary format with genre information
-    shows = [
-        {
-            "show_id": result.show_id,
-            "title": result.title,
-            "release_year": result.release_year,
-            "age_certification": result.age_certification,
-            "runtime": result.runtime,
-            "seasons": result.seasons,
-            "genre": result.genre,
-        }
-        for result in results
-    ]
-
-    return shows
+        query += lambda s: s.where(text_search(models.Genres.genre, 'genre'))
+        params['genre'] = search_value(genre)
+
+    # Seek past the previous page instead of scanning and discarding skipped rows
+    if cursor is not None:
+        query += lambda s: s.where(models.GenresBridge.index > bindparam('cursor'))
+        params['cursor'] = cursor
+    else:
+        query += lambda s: s.offset(bindparam('skip'))
+    query += lambda s: s.order_by(models.GenresBridge.index).limit(bindparam('limit'))
+
+    results = db.execute(query, params).all()  # Fetch paginated results
+    has_more = len(results) > limit
+    results = results[:limit]
+    next_cursor = results[-1].bridge_index if has_more and results else None
+
+    # Copy each row mapping once and take the cursor column out of it
+    shows = []
+    for result in results:
+        item = dict(result._mapping)
+        del item['bridge_index']
+        shows.append(item)
+
+    return {"items": shows, "has_more": has_more, "next_cursor": next_cursor}
 
 def get_media(
     db: Session,
@@ -223,12 +341,16 @@ def get_media(
     imdb_score: Optional[float] = None,
     imdb_votes: Optional[int] = None,
     skip: int = 0,
-    limit: int = 100
-) -> List[dict]:
-    query = db.query(models.MoviesAndShowsView)
+    limit: int = 100,
+    cursor: Optional[int] = None
+) -> dict:
     """
     Fetches media (movies and shows) based on detailed criteria.
 
+    Reads the materialized movies_and_shows_mv table and returns one record per title: the
+    title's first row matching the filters. Pages are ordered by that row's row_id and seek
+    past the cursor instead of using OFFSET.
+
     Args:
         db (Session): Database session object.
         media_type (str, optional): Type of media ('movie' or 'show').
@@ -242,59 +364,179 @@ def get_media(
         character (str, optional): Character name in the movie or show.
         imdb_score (float, optional): IMDb score of the movie or show.
         imdb_votes (int, optional): Number of IMDb votes for the movie or show.
-        skip (int, optional): Number of records to skip (for pagination).
+        skip (int, optional): Number of records to skip (deprecated OFFSET pagination, ignored when cursor is set).
         limit (int, optional): Maximum number of records to fetch.
+        cursor (int, optional): Cursor returned with the previous page.
 
     Returns:
-        List[dict]: List of dictionaries representing media records with genre information.
+        dict: Page with media records under 'items', whether more follow under 'has_more'
+            and the cursor of the next page under 'next_cursor'.
     """
-    
+    # One extra title is fetched to tell whether another page follows without a COUNT query
+    params = {'skip': skip, 'limit': limit + 1}
+
+    # The table holds one row per genre, country, director and actor combination of a title, so pages
+    # are made of titles: the first matching row of each (media_type, index) represents the title, and
+    # its row_id is the title's position and cursor. The statement is built from cached lambdas:
+    # SQLAlchemy keys the construction and compiled SQL on the lambdas' code, so each filter
+    # combination is only built once and values are bound by name
+    first_row_id = func.min(models.MoviesAndShowsView.row_id)
+    query = lambda_stmt(lambda: select(first_row_id).group_by(
+        models.MoviesAndShowsView.media_type,
+        models.MoviesAndShowsView.index
+    ))
+
     # Apply filters based on the provided parameters
-    if media_type is not None:
-        query = query.filter(models.MoviesAndShowsView.media_type.ilike(f"%{media_type}%"))
+    if media_type is not None and media_type.lower() in MEDIA_TYPES:
+        # An exact media type is an equality seek on the (media_type, row_id) index, so only
+        # that half of the table is read instead of pattern matching every row
+        query += lambda s: s.where(models.MoviesAndShowsView.media_type == bindparam('media_type'))
+        params['media_type'] = media_type.lower()
+    elif media_type is not None:
+        query += lambda s: s.where(models.MoviesAndShowsView.media_type.ilike(bindparam('media_type')))
+        params['media_type'] = f"%{media_type}%"
     if title is not None:
-        query = query.filter(models.MoviesAndShowsView.title.ilike(f"%{title}%"))
+        query += lambda s: s.where(text_search(models.MoviesAndShowsView.title, 'title'))
+        params['title'] = search_value(title)
     if release_year is not None:
-        query = query.filter(models.MoviesAndShowsView.release_year == release_year)
+        query += lambda s: s.where(models.MoviesAndShowsView.release_year == bindparam('release_year'))
+        params['release_year'] = release_year
     if age_certification is not None:
-        query = query.filter(models.MoviesAndShowsView.age_certification == age_certification)
+        query += lambda s: s.where(models.MoviesAndShowsView.age_certification == bindparam('age_certification'))
+        params['age_certification'] = age_certification
     if genre is not None:
-        query = query.filter(models.MoviesAndShowsView.genre.ilike(f"%{genre}%"))
+        query += lambda s: s.where(text_search(models.MoviesAndShowsView.genre, 'genre'))
+        params['genre'] = search_value(genre)
     if country is not None:
-        query = query.filter(models.MoviesAndShowsView.country.ilike(f"%{country}%"))
+        query += lambda s: s.where(models.MoviesAndShowsView.country.ilike(bindparam('country')))
+        params['country'] = f"%{country}%"
     if director is not None:
-        query = query.filter(models.MoviesAndShowsView.director.ilike(f"%{director}%"))
+        query += lambda s: s.where(text_search(models.MoviesAndShowsView.director, 'director'))
+        params['director'] = search_value(director)
     if actor is not None:
-        query = query.filter(models.MoviesAndShowsView.actor.ilike(f"%{actor}%"))
+        query += lambda s: s.where(text_search(models.MoviesAndShowsView.actor, 'actor'))
+        params['actor'] = search_value(actor)
     if character is not None:
-        query = query.filter(models.MoviesAndShowsView.character.ilike(f"%{character}%"))
+        query += lambda s: s.where(text_search(models.MoviesAndShowsView.character, 'character'))
+        params['character'] = search_value(character)
     if imdb_score is not None:
-        query = query.filter(models.MoviesAndShowsView.imdb_score > imdb_score)
+        query += lambda s: s.where(models.MoviesAndShowsView.imdb_score > bindparam('imdb_score'))
+        params['imdb_score'] = imdb_score
     if imdb_votes is not None:
-        query = query.filter(models.MoviesAndShowsView.imdb_votes > imdb_votes)
-    
-    results = query.offset(skip).limit(limit).all()  # Fetch paginated results
-
-    # Convert results to dictionary format with genre information
-    media = [
-        {   
-            "movie_id": result.movie_id,
-            "show_id": result.show_id,
-            "media_type": result.media_type,
-            "title": result.title,
-            "release_year": result.release_year,
-            "age_certification": result.age_certification,
-            "runtime": result.runtime,
-            "seasons": result.seasons,
-            "genre": result.genre,
-            "country": result.country,
-            "director": result.director,
-            "actor": result.actor,
-            "character": result.character,
-            "imdb_score": result.imdb_score,
-            "imdb_votes": result.imdb_votes
-        }
-        for result in results
-    ]
-
-    return media
\ No newline at end of file
+        query += lambda s: s.where(models.MoviesAndShowsView.imdb_votes > bindparam('imdb_votes'))
+        params['imdb_votes'] = imdb_votes
+
+    # Seek past the previous page instead of scanning and discarding skipped titles
+    if cursor is not None:
+        query += lambda s: s.having(first_row_id > bindparam('cursor'))
+        params['cursor'] = cursor
+    else:
+        query += lambda s: s.offset(bindparam('skip'))
+    query += lambda s: s.order_by(first_row_id).limit(bindparam('limit'))
+
+    row_ids = db.execute(query, params).scalars().all()
+    has_more = len(row_ids) > limit
+    row_ids = row_ids[:limit]
+    next_cursor = row_ids[-1] if has_more and row_ids else None
+
+    # Fetch the representative row of every title on the page, selecting plain columns
+    # (in response order) so rows skip ORM entity hydration
+    rows = db.execute(lambda_stmt(lambda: select(
+        models.MoviesAndShowsView.media_type,
+        models.MoviesAndShowsView.movie_id,
+        models.MoviesAndShowsView.show_id,
+        models.MoviesAndShowsView.title,
+        models.MoviesAndShowsView.release_year,
+        models.MoviesAndShowsView.age_certification,
+        models.MoviesAndShowsView.runtime,
+        models.MoviesAndShowsView.genre,
+        models.MoviesAndShowsView.country,
+        models.MoviesAndShowsView.director,
+        models.MoviesAndShowsView.actor,
+        models.MoviesAndShowsView.character,
+        models.MoviesAndShowsView.imdb_score,
+        models.MoviesAndShowsView.imdb_votes
+    ).where(models.MoviesAndShowsView.row_id.in_(bindparam('row_ids', expanding=True)))
+     .order_by(models.MoviesAndShowsView.row_id)), {'row_ids': row_ids}) if row_ids else []
+
+    # Each row mapping already carries the response keys, copy it once per row
+    media = [dict(row._mapping) for row in rows]
+
+    return {"items": media, "has_more": has_more, "next_cursor": next_cursor}
+
+# Functions related to Predictions
+
+def create_prediction(db: Session, prediction: schemas.PredictionAdd) -> dict:
+    """
+    Inserts a new prediction record.
+
+    The timestamp comes from the column's server default, so every prediction is stamped by the
+    database clock. The key and timestamp come back with the INSERT itself where the database
+    supports RETURNING; MySQL has none, so there they are read back by the new primary key.
+
+    Args:
+        db (Session): Database session object.
+        prediction (schemas.PredictionAdd): Prediction data to be stored.
+
+    Returns:
+        dict: The stored prediction record.
+    """
+    values = {
+        'user_id': prediction.user_id,
+        'prediction_value': prediction.prediction_value,
+    }
+    query = insert(models.Predictions).values(**values)
+    if db.get_bind().dialect.insert_returning:
+        stored = db.execute(query.returning(models.Predictions.index, models.Predictions.timestamp)).one()
+    else:
+        index = db.execute(query).inserted_primary_key[0]
+        stored = db.execute(
+            select(models.Predictions.index, models.Predictions.timestamp).where(models.Predictions.index == index)
+        ).one()
+    db.commit()
+
+    return {**stored._mapping, **values}
+
+def get_predictions(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[int] = None,
+    since: Optional[datetime] = None
+):
+    """
+    Fetches a page of predictions from the database.
+
+    Pages are ordered by the primary key and seek past the cursor, like the movie and show pages.
+
+    Args:
+        db (Session): Database session object.
+        skip (int): Number of records to skip (deprecated OFFSET pagination, ignored when cursor is set).
+        limit (int): Maximum number of records to fetch.
+        cursor (int, optional): Index of the last prediction on the previous page.
+        since (datetime, optional): Only return predictions made at or after this time.
+
+    Returns:
+        dict: Page with the prediction records under 'items', whether more follow under 'has_more'
+            and the cursor of the next page under 'next_cursor'.
+    """
+    query = select(
+        models.Predictions.index,
+        models.Predictions.timestamp,
+        models.Predictions.user_id,
+        models.Predictions.prediction_value
+    ).order_by(models.Predictions.index)
+    if since is not None:
+        query = query.where(models.Predictions.timestamp >= since)
+    if cursor is not None:
+        query = query.where(models.Predictions.index > cursor)
+    else:
+        query = query.offset(skip)
+
+    # Fetch one extra row to tell whether another page follows without a COUNT query
+    rows = db.execute(query.limit(limit + 1)).all()
+    has_more = len(rows) > limit
+    predictions = [dict(row._mapping) for row in rows[:limit]]
+    next_cursor = predictions[-1]['index'] if has_more and predictions else None
+
+    return {"items": predictions, "has_more": has_more, "next_cursor": next_cursor}
@@ -6,8 +6,23 @@ from decouple import config
 # Load environment variables
 CONNECTION_STRING = config('CONNECTION_STRING')
 
+# Search indexes are declared on the models and created together with the tables:
+# - PostgreSQL: pg_trgm extension plus GIN (col gin_trgm_ops) indexes on movies.title, shows.title,
+#   actors.actor and characters.character, which serve the ILIKE '%term%' filters,
+#   and GIN to_tsvector('simple', col) indexes used when FULLTEXT_SEARCH is enabled
+# - MySQL: FULLTEXT indexes used when FULLTEXT_SEARCH is enabled
+
 # Create a database engine
-engine = create_engine(CONNECTION_STRING)
+# FastAPI runs the sync endpoints in a threadpool, so the pool is sized for concurrent requests;
+# pre-ping and recycle drop connections the server has closed instead of failing a request on them
+engine = create_engine(
+    CONNECTION_STRING,
+    pool_size=config('DB_POOL_SIZE', default=20, cast=int),
+    max_overflow=config('DB_MAX_OVERFLOW', default=10, cast=int),
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    pool_timeout=30
+)
 
 # Create a declarative base
 Base = declarative_base()
@@ -1,16 +1,40 @@
 import requests
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from typing import List, Optional, Tuple
 from decouple import config
 
 class RecommenderEngine:
-    def __init__(self, base_url: str):
+    def __init__(self, base_url: str, pool_size: int = 20, timeout: float = 30):
         """
         Initialize the RecommenderEngine with a base URL.
 
         Args:
             base_url (str): The base URL of the API.
+            pool_size (int): Maximum number of connections kept alive to the API.
+            timeout (float): Timeout in seconds for each request.
         """
         self.base_url = base_url.rstrip('/')
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        # Reuse keep-alive connections across calls instead of opening a new one per request
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def close(self):
+        """
+        Close the pooled connections to the API.
+        """
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
 
     def submit_prediction(self, user_id: str, prediction_value: float):
         """
@@ -25,28 +49,53 @@ class RecommenderEngine:
         """
         url = f"{self.base_url}/submit_prediction/"
         payload = {"user_id": user_id, "prediction_value": prediction_value}
-        response = requests.post(url, json=payload)
+        response = self.session.post(url, json=payload, timeout=self.timeout)
         if response.status_code == 200:
             return response.json()
         else:
             print(f"Failed to submit prediction: {response.status_code} - {response.text}")
             return None
 
-    def get_predictions(self) -> List[float]:
+    def submit_many(self, predictions: List[Tuple[str, float]]) -> List[dict]:
         """
-        Fetch predictions from the API.
+        Submit several predictions to the API concurrently over the pooled connections.
+
+        Args:
+            predictions (list): (user_id, prediction_value) pairs to submit.
 
         Returns:
-            list: A list of prediction values fetched from the API.
+            list: The JSON response (or None on failure) for each prediction, in input order.
+        """
+        with ThreadPoolExecutor(max_workers=self.pool_size) as executor:
+            return list(executor.map(lambda prediction: self.submit_prediction(*prediction), predictions))
+
+    def get_predictions(self, since: Optional[str] = None, page_size: int = 1000) -> List[dict]:
+        """
+        Fetch predictions from the API, following the page cursors until the last page.
+
+        Args:
+            since (str, optional): ISO timestamp, only predictions made at or after it are fetched.
+            page_size (int): Number of predictions requested per page (at most 1000).
+
+        Returns:
+            list: A list of prediction records fetched from the API.
         """
         url = f"{self.base_url}/get_predictions/"
-        response = requests.get(url)
-        if response.status_code == 200:
-            predictions = response.json()
-            return [{'index': prediction['index'], 'timestamp': prediction['timestamp'], 'user_id': prediction['user_id'], 'prediction_value': prediction['prediction_value']} for prediction in predictions]
-        else:
-            print(f"Failed to fetch predictions: {response.status_code} - {response.text}")
-            return []
+        params = {'limit': page_size}
+        if since is not None:
+            params['since'] = since
+
+        predictions = []
+        while True:
+            response = self.session.get(url, params=params, timeout=self.timeout)
+            if response.status_code != 200:
+                print(f"Failed to fetch predictions: {response.status_code} - {response.text}")
+                return predictions
+            page = response.json()
+            predictions.extend(page['items'])
+            if not page['has_more']:
+                return predictions
+            params['cursor'] = page['next_cursor']
 
 if __name__ == "__main__":
     # Load base URL from environment variables using python-decouple
@@ -71,3 +120,5 @@ if __name__ == "__main__":
     # Example: Fetching predictions
     predictions = recommender.get_predictions()
     print(f"Fetched predictions: {predictions}")
+
+    recommender.close()
@@ -1,21 +1,71 @@
-from typing import List, Optional
-from fastapi import FastAPI, HTTPException, Depends, Query
-from fastapi.responses import HTMLResponse, JSONResponse
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
+from hashlib import blake2b
+from threading import Lock
+from typing import Callable, List, Optional
+from cachetools import TTLCache
+from decouple import config
+from fastapi import FastAPI, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from . import crud, models, schemas  # Importing local modules
 from .database import SessionLocal, engine  # Importing database session and engine
 from sqlalchemy.orm import Session
-import json
+import orjson
 
-# Custom JSONResponse class to pretty-print JSON responses
-class PrettyJSONResponse(JSONResponse):
+# Custom ORJSONResponse class to pretty-print JSON responses (orjson only supports 2-space indent)
+class PrettyJSONResponse(ORJSONResponse):
     def render(self, content: any) -> bytes:
-        return json.dumps(content, indent=4, ensure_ascii=False).encode("utf-8")
+        return orjson.dumps(content, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
 
-# Creating FastAPI instance
-app = FastAPI(default_response_class=PrettyJSONResponse)
+# Rendered bodies of the hot read-only pages, keyed on the request parameters. Movie and show data is only
+# changed by the ETL pipeline, so cached bodies and their ETags simply expire after CACHE_TTL seconds
+CACHE_TTL = 30
+page_cache = TTLCache(maxsize=256, ttl=CACHE_TTL)
+page_cache_lock = Lock()
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Tells whether an If-None-Match header matches an ETag, using the weak comparison the header calls for:
+    '*' matches any ETag, and a list of tags matches when any of them, W/ prefix ignored, equals the ETag.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+def cached_json_response(request: Request, key: tuple, load: Callable[[], dict]) -> Response:
+    """
+    Serves a JSON page from the page cache, rendering it with load() on a miss.
 
-# Creating database tables
-models.Base.metadata.create_all(bind=engine)
+    Answers 304 Not Modified when the client's If-None-Match matches the page's ETag.
+    """
+    with page_cache_lock:
+        cached = page_cache.get(key)
+    if cached is None:
+        body = PrettyJSONResponse(content=load()).body
+        etag = f'"{blake2b(body, digest_size=16).hexdigest()}"'
+        cached = (body, etag)
+        with page_cache_lock:
+            page_cache[key] = cached
+    body, etag = cached
+
+    headers = {"ETag": etag, "Cache-Control": f"max-age={CACHE_TTL}, public"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# Creating database tables once at startup when INIT_DB is set (the ETL pipeline normally creates them),
+# instead of checking every table on each import of this module
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if config('INIT_DB', default=False, cast=bool):
+        models.Base.metadata.create_all(bind=engine)
+    yield
+
+# Creating FastAPI instance
+app = FastAPI(default_response_class=PrettyJSONResponse, lifespan=lifespan)
 
 # Dependency function to get database session
 def get_db():
@@ -31,6 +81,11 @@ def read_root():
     """
     Returns HTML content with links to available API endpoints.
     """
+    return HTMLResponse(content=root_html())
+
+# The root page never changes, so it is encoded once and reused
+@lru_cache(maxsize=1)
+def root_html() -> bytes:
     html_content = """
     <html>
         <head>
@@ -56,24 +111,35 @@ def read_root():
         </body>
     </html>
     """
-    return html_content
+    return html_content.encode("utf-8")
 
 # Endpoint to fetch movies with optional pagination
-@app.get("/movies/", response_model=List[schemas.MovieBase])
-def read_movies(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@app.get("/movies/", response_model=schemas.Page[schemas.MovieBase])
+def read_movies(
+    request: Request,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
     """
-    Fetches a list of movies with optional pagination.
+    Fetches a page of movies.
+
+    Pages are cached for a short time and carry an ETag, a matching If-None-Match gets 304 Not Modified.
 
     Parameters:
-    - skip (int): Number of records to skip.
-    - limit (int): Maximum number of records to fetch.
+    - request (Request): Incoming request, read for If-None-Match.
+    - skip (int): Number of records to skip (deprecated, use cursor instead).
+    - limit (int): Maximum number of records to fetch, at most 1000.
+    - cursor (int, optional): `next_cursor` value returned with the previous page.
     - db (Session): Database session dependency.
 
     Returns:
-    - List[schemas.MovieBase]: List of movie records.
+    - schemas.Page[schemas.MovieBase]: Page of movie records and the cursor of the next page.
     """
-    movies = crud.get_movies(db, skip=skip, limit=limit)
-    return movies
+    # Rows already match schemas.MovieBase, so they are rendered without per-row model validation
+    return cached_json_response(request, ("movies", skip, limit, cursor),
+                                lambda: crud.get_movies(db, skip=skip, limit=limit, cursor=cursor))
 
 # Endpoint to fetch movies by actor name
 @app.get("/movies/movies_by_actor/", response_model=List[schemas.MovieActors])
@@ -103,6 +169,9 @@ def read_movie_by_rating(
     """
     Fetches a movie that is rated best on IMDB site.
 
+    Only movies with an IMDB score are ranked: unrated movies are never returned, and the list is
+    empty when none of the movies matching the filters has a score.
+
     Parameters:
     - release_year (int, optional): Release year of the movie.
     - genre (str, optional): Genre of the movie.
@@ -115,31 +184,43 @@ def read_movie_by_rating(
     return movies
 
 # Endpoint to fetch shows with optional pagination
-@app.get("/shows/", response_model=List[schemas.ShowBase])
-def read_shows(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@app.get("/shows/", response_model=schemas.Page[schemas.ShowBase])
+def read_shows(
+    request: Request,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
     """
-    Fetches a list of shows with optional pagination.
+    Fetches a page of shows.
+
+    Pages are cached for a short time and carry an ETag, a matching If-None-Match gets 304 Not Modified.
 
     Parameters:
-    - skip (int): Number of records to skip.
-    - limit (int): Maximum number of records to fetch.
+    - request (Request): Incoming request, read for If-None-Match.
+    - skip (int): Number of records to skip (deprecated, use cursor instead).
+    - limit (int): Maximum number of records to fetch, at most 1000.
+    - cursor (int, optional): `next_cursor` value returned with the previous page.
     - db (Session): Database session dependency.
 
     Returns:
-    - List[schemas.ShowBase]: List of show records.
+    - schemas.Page[schemas.ShowBase]: Page of show records and the cursor of the next page.
     """
-    shows = crud.get_shows(db, skip=skip, limit=limit)
-    return shows
+    # Rows already match schemas.ShowBase, so they are rendered without per-row model validation
+    return cached_json_response(request, ("shows", skip, limit, cursor),
+                                lambda: crud.get_shows(db, skip=skip, limit=limit, cursor=cursor))
 
 # Endpoint to fetch shows by detailed criteria
-@app.get("/shows/shows_by_details/", response_model=List[schemas.ShowGenres])
+@app.get("/shows/shows_by_details/", response_model=schemas.Page[schemas.ShowGenres])
 def read_shows_by_details(
     title: Optional[str] = Query(None, min_length=3, max_length=50),
     release_year: Optional[int] = Query(None, ge=1888, le=2100),
     age_certification: Optional[str] = Query(None, min_length=1, max_length=10),
     genre: Optional[str] = Query(None, min_length=1, max_length=20),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = Query(None, ge=0),
     db: Session = Depends(get_db)
 ):
     """
@@ -150,20 +231,22 @@ def read_shows_by_details(
     - release_year (int, optional): Release year of the show.
     - age_certification (str, optional): Age certification of the show.
     - genre (str, optional): Genre of the show.
-    - skip (int): Number of records to skip.
-    - limit (int): Maximum number of records to fetch.
+    - skip (int): Number of records to skip (deprecated, use cursor instead).
+    - limit (int): Maximum number of records to fetch, at most 1000.
+    - cursor (int, optional): `next_cursor` value returned with the previous page.
     - db (Session): Database session dependency.
 
     Returns:
-    - List[schemas.ShowGenres]: List of show records with genre information.
+    - schemas.Page[schemas.ShowGenres]: Page of show records with genre information and the cursor of the next page.
     """
     shows = crud.get_shows_by_details(db, title=title, release_year=release_year, 
                                       age_certification=age_certification, genre=genre, 
-                                      skip=skip, limit=limit)
-    return shows
+                                      skip=skip, limit=limit, cursor=cursor)
+    # Rows already match schemas.ShowGenres, so return them without per-row model validation
+    return PrettyJSONResponse(content=shows)
 
 # Endpoint to fetch movies and shows by detailed criteria
-@app.get("/media_details/", response_model=List[schemas.MovieShow])
+@app.get("/media_details/", response_model=schemas.Page[schemas.MovieShow])
 def read_media(
     media_type: Optional[str] = Query(None, min_length=1, max_length=10),
     title: Optional[str] = Query(None, min_length=3, max_length=50),
@@ -176,8 +259,9 @@ def read_media(
     character: Optional[str] = Query(None, min_length=1, max_length=50),
     imdb_score: Optional[float] = Query(None),
     imdb_votes: Optional[int] = Query(None),
-    skip: int = 0,
-    limit: int = 100,
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = Query(None, ge=0),
     db: Session = Depends(get_db)
 ):
     """
@@ -195,18 +279,20 @@ def read_media(
     - character (str, optional): Character name in the media.
     - imdb_score (float, optional): IMDb score of the media (lists media rated greater than given value).
     - imdb_votes (int, optional): Number of IMDb votes (lists media that have more votes than given value).
-    - skip (int, optional): Number of records to skip for pagination.
-    - limit (int, optional): Maximum number of records to fetch.
+    - skip (int, optional): Number of records to skip for pagination (deprecated, use cursor instead).
+    - limit (int, optional): Maximum number of records to fetch, at most 1000.
+    - cursor (int, optional): `next_cursor` value returned with the previous page.
 
     Returns:
-    - List[schemas.MovieShow]: List of movies and shows matching the criteria.
+    - schemas.Page[schemas.MovieShow]: Page of movies and shows matching the criteria and the cursor of the next page.
     """
     media = crud.get_media(db, media_type=media_type, title=title, release_year=release_year, 
                                       age_certification=age_certification, genre=genre,
                                       country=country, director=director,
                                       actor=actor, character=character, imdb_score=imdb_score, imdb_votes=imdb_votes,
-                                      skip=skip, limit=limit)
-    return media
+                                      skip=skip, limit=limit, cursor=cursor)
+    # Rows already match schemas.MovieShow, so return them without per-row model validation
+    return PrettyJSONResponse(content=media)
 
 # Endpoint to submit a prediction
 @app.post("/submit_prediction/", response_model=schemas.PredictionAdd)
@@ -221,23 +307,31 @@ def submit_prediction(prediction: schemas.PredictionAdd, db: Session = Depends(g
     Returns:
     - schemas.PredictionAdd: Created prediction record.
     """
-    db_prediction = models.Predictions(user_id=prediction.user_id, prediction_value=prediction.prediction_value)
-    db.add(db_prediction)
-    db.commit()
-    db.refresh(db_prediction)
+    db_prediction = crud.create_prediction(db, prediction)
     return db_prediction
 
-# Endpoint to fetch all predictions
-@app.get("/get_predictions/", response_model=List[schemas.PredictionResponse])
-def get_predictions(db: Session = Depends(get_db)):
+# Endpoint to fetch predictions with optional pagination
+@app.get("/get_predictions/", response_model=schemas.Page[schemas.PredictionResponse])
+def get_predictions(
+    skip: int = Query(0, ge=0, deprecated=True),
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = Query(None, ge=0),
+    since: Optional[datetime] = None,
+    db: Session = Depends(get_db)
+):
     """
-    Fetches all predictions stored in the database.
+    Fetches a page of the predictions stored in the database.
 
     Parameters:
+    - skip (int): Number of records to skip (deprecated, use cursor instead).
+    - limit (int): Maximum number of records to fetch, at most 1000.
+    - cursor (int, optional): `next_cursor` value returned with the previous page.
+    - since (datetime, optional): Only return predictions made at or after this time.
     - db (Session): Database session dependency.
 
     Returns:
-    - List[schemas.PredictionResponse]: List of prediction records.
+    - schemas.Page[schemas.PredictionResponse]: Page of prediction records and the cursor of the next page.
     """
-    predictions = db.query(models.Predictions).all()
-    return predictions
+    predictions = crud.get_predictions(db, skip=skip, limit=limit, cursor=cursor, since=since)
+    # Rows already match schemas.PredictionResponse, so return them without per-row model validation
+    return PrettyJSONResponse(content=predictions)
@@ -1,8 +1,59 @@
-from sqlalchemy import ForeignKeyConstraint, Column, String, Integer, Float, DateTime
+from sqlalchemy import DDL, ForeignKeyConstraint, Index, Column, String, Integer, Float, DateTime, event, func, literal_column, desc
+# Registers PostgreSQL's typed to_tsvector(), without which the GIN index expressions fail to compile
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import relationship
-from datetime import datetime, timezone, timedelta
 from .database import Base
 
+def full_text_indexes(name, column):
+    """
+    Builds the full-text indexes that back the API's FULLTEXT_SEARCH mode.
+
+    Each index is only emitted on its own dialect, other backends skip both.
+
+    Args:
+        name (str): Suffix for the index names.
+        column (Column): Text column to index.
+
+    Returns:
+        tuple: MySQL FULLTEXT index and PostgreSQL GIN index over to_tsvector('simple', column).
+    """
+    return (
+        Index(f"ft_{name}", column, mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+        Index(
+            f"gin_{name}",
+            func.to_tsvector(literal_column("'simple'"), column),
+            postgresql_using="gin"
+        ).ddl_if(dialect="postgresql")
+    )
+
+def trigram_index(name, column_name):
+    """
+    Builds a PostgreSQL pg_trgm GIN index so substring ILIKE '%term%' filters can use an index.
+
+    Native ILIKE is served directly by the trigram index, so the filters must not be
+    rewritten as lower(column) LIKE. The index is skipped on other dialects.
+
+    Args:
+        name (str): Suffix for the index name.
+        column_name (str): Name of the text column to index.
+
+    Returns:
+        Index: GIN index using the gin_trgm_ops operator class.
+    """
+    return Index(
+        f"trgm_{name}",
+        column_name,
+        postgresql_using="gin",
+        postgresql_ops={column_name: "gin_trgm_ops"}
+    ).ddl_if(dialect="postgresql")
+
+# The trigram operator classes come from the pg_trgm extension, install it before creating tables
+event.listen(
+    Base.metadata,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
 class Movies(Base):
     """
     Represents the movies table in the database.
@@ -17,29 +68,17 @@ class Movies(Base):
     """
     __tablename__ = "movies"
 
-    index = Column(Integer, primary_key=True, unique=True, index=True, autoincrement=True)
-    movie_id = Column(String(128), index=True)
+    index = Column(Integer, primary_key=True, autoincrement=True)
+    movie_id = Column(String(16), unique=True)
     title = Column(String(512))
     release_year = Column(Integer)
-    age_certification = Column(String(512))
+    age_certification = Column(String(16))
     runtime = Column(Integer)
 
-    def __init__(self, movie_id, title, release_year, age_certification, runtime):
-        """
-        Initializes a Movies instance.
-
-        Args:
-            movie_id (str): Unique identifier for the movie.
-            title (str): Title of the movie.
-            release_year (int): Year the movie was released.
-            age_certification (str): Age certification for the movie.
-            runtime (int): Runtime of the movie in minutes.
-        """
-        self.movie_id = movie_id
-        self.title = title
-        self.release_year = release_year 
-        self.age_certification = age_certification
-        self.runtime = runtime
+    __table_args__ = full_text_indexes("movies_title", title) + (
+        trigram_index("movies_title", "title"),
+        Index("ix_movies_release_year_movie_id", release_year, movie_id),
+    )
 
     def __repr__(self):
         """
@@ -68,32 +107,15 @@ class Shows(Base):
     """
     __tablename__ = "shows"
 
-    index = Column(Integer, primary_key=True, unique=True, index=True, autoincrement=True)
-    show_id = Column(String(128), index=True)
+    index = Column(Integer, primary_key=True, autoincrement=True)
+    show_id = Column(String(16), unique=True)
     title = Column(String(512))
     release_year = Column(Integer)
-    age_certification = Column(String(512))
+    age_certification = Column(String(16))
     runtime = Column(Integer)
     seasons = Column(Integer)
 
-    def __init__(self, show_id, title, release_year, age_certification, runtime, seasons):
-        """
-        Initializes a Shows instance.
-
-        Args:
-            show_id (str): Unique identifier for the show.
-            title (str): Title of the show.
-            release_year (int): Year the show was released.
-            age_certification (str): Age certification for the show.
-            runtime (int): Runtime of the show in minutes.
-            seasons (int): Number of seasons of the show.
-        """
-        self.show_id = show_id
-        self.title = title
-        self.release_year = release_year 
-        self.age_certification = age_certification
-        self.runtime = runtime
-        self.seasons = seasons
+    __table_args__ = full_text_indexes("shows_title", title) + (trigram_index("shows_title", "title"),)
 
     def __repr__(self):
         """
@@ -117,19 +139,10 @@ class Genres(Base):
     """
     __tablename__ = "genres"
     
-    genre_id = Column(Integer, primary_key=True, unique=True, index=True)
+    genre_id = Column(Integer, primary_key=True)
     genre = Column(String(255))
 
-    def __init__(self, genre_id, genre):
-        """
-        Initializes a Genres instance.
-
-        Args:
-            genre_id (int): Primary key for the genres table.
-            genre (str): Genre name.
-        """
-        self.genre_id = genre_id
-        self.genre = genre
+    __table_args__ = full_text_indexes("genres_genre", genre)
 
     def __repr__(self):
         """
@@ -152,32 +165,20 @@ class GenresBridge(Base):
     """
     __tablename__ = "genres_bridge"
     # Define conditional relationships
-    movie = relationship("Movies", primaryjoin="GenresBridge.movie_id == Movies.movie_id", uselist=False)
-    show = relationship("Shows", primaryjoin="GenresBridge.show_id == Shows.show_id", uselist=False)
-    genre = relationship("Genres", primaryjoin="GenresBridge.genre_id == Genres.genre_id", uselist=False)
+    movie = relationship("Movies", primaryjoin="GenresBridge.movie_id == Movies.movie_id", uselist=False, lazy="raise")
+    show = relationship("Shows", primaryjoin="GenresBridge.show_id == Shows.show_id", uselist=False, lazy="raise")
+    genre = relationship("Genres", primaryjoin="GenresBridge.genre_id == Genres.genre_id", uselist=False, lazy="raise")
     __table_args__ = (
         ForeignKeyConstraint(['movie_id'], ['movies.movie_id'], name='fk_g_movie_id'),
         ForeignKeyConstraint(['show_id'], ['shows.show_id'], name='fk_g_show_id'),
-        ForeignKeyConstraint(['genre_id'], ['genres.genre_id'], name='fk_genre_id')
+        ForeignKeyConstraint(['genre_id'], ['genres.genre_id'], name='fk_genre_id'),
+        Index("ix_genres_bridge_genre_id_movie_id", "genre_id", "movie_id")
     )
     index = Column(Integer, primary_key=True, autoincrement=True)
-    movie_id = Column(String(128))
-    show_id = Column(String(128))
+    movie_id = Column(String(16), index=True)
+    show_id = Column(String(16), index=True)
     genre_id = Column(Integer, nullable=False)
 
-    def __init__(self, movie_id, show_id, genre_id):
-        """
-        Initializes a GenresBridge instance.
-
-        Args:
-            movie_id (str): Unique identifier for the movie.
-            show_id (str): Unique identifier for the show.
-            genre_id (int): Foreign key for the genres table.
-        """
-        self.movie_id = movie_id
-        self.show_id = show_id
-        self.genre_id = genre_id
-
     def __repr__(self):
         """
         Provides a string representation of the GenresBridge instance.
@@ -197,20 +198,9 @@ class ProductionCountries(Base):
     """
     __tablename__ = "production_countries"
     
-    country_id = Column(Integer, primary_key=True, unique=True, index=True)
+    country_id = Column(Integer, primary_key=True)
     country = Column(String(255))
 
-    def __init__(self, country_id, country):
-        """
-        Initializes a ProductionCountries instance.
-
-        Args:
-            country_id (int): Primary key for the production_countries table.
-            country (str): Name of the production country.
-        """
-        self.country_id = country_id
-        self.country = country
-
     def __repr__(self):
         """
         Provides a string representation of the ProductionCountries instance.
@@ -232,31 +222,18 @@ class ProductionCountriesBridge(Base):
     """
     __tablename__ = "production_countries_bridge"
     # Define conditional relationships
-    movie = relationship("Movies", primaryjoin="ProductionCountriesBridge.movie_id == Movies.movie_id", uselist=False)
-    show = relationship("Shows", primaryjoin="ProductionCountriesBridge.show_id == Shows.show_id", uselist=False)
-    production_country = relationship("ProductionCountries", primaryjoin="ProductionCountriesBridge.country_id == ProductionCountries.country_id", uselist=False)
+    movie = relationship("Movies", primaryjoin="ProductionCountriesBridge.movie_id == Movies.movie_id", uselist=False, lazy="raise")
+    show = relationship("Shows", primaryjoin="ProductionCountriesBridge.show_id == Shows.show_id", uselist=False, lazy="raise")
+    production_country = relationship("ProductionCountries", primaryjoin="ProductionCountriesBridge.country_id == ProductionCountries.country_id", uselist=False, lazy="raise")
     __table_args__ = (
         ForeignKeyConstraint(['movie_id'], ['movies.movie_id'], name='fk_pc_movie_id'),
         ForeignKeyConstraint(['show_id'], ['shows.show_id'], name='fk_pc_show_id'),
         ForeignKeyConstraint(['country_id'], ['production_countries.country_id'], name='fk_country_id')
     )
     index = Column(Integer, primary_key=True, autoincrement=True)
-    movie_id = Column(String(128))
-    show_id = Column(String(128))
-    country_id = Column(Integer, nullable=False)
-
-    def __init__(self, movie_id, show_id, country_id):
-        """
-        Initializes a ProductionCountriesBridge instance.
-
-        Args:
-            movie_id (str): Unique identifier for the movie.
-            show_id (str): Unique identifier for the show.
-            country_id (int): Foreign key for the production_countries table.
-        """
-        self.movie_id = movie_id
-        self.show_id = show_id
-        self.country_id = country_id
+    movie_id = Column(String(16), index=True)
+    show_id = Column(String(16), index=True)
+    country_id = Column(Integer, nullable=False, index=True)
 
     def __repr__(self):
         """
@@ -278,20 +255,11 @@ class Actors(Base):
     """
     __tablename__ = "actors"
 
-    index = Column(Integer, primary_key=True, unique=True, index=True, autoincrement=True)
-    actor_id = Column(Integer, index=True)
+    index = Column(Integer, primary_key=True, autoincrement=True)
+    actor_id = Column(Integer, unique=True)
     actor = Column(String(512))
 
-    def __init__(self, actor_id, actor):
-        """
-        Initializes an Actors instance.
-
-        Args:
-            actor_id (int): Unique identifier for the actor.
-            actor (str): Name of the actor.
-        """
-        self.actor_id = actor_id
-        self.actor = actor
+    __table_args__ = full_text_indexes("actors_actor", actor) + (trigram_index("actors_actor", "actor"),)
 
     def __repr__(self):
         """
@@ -314,32 +282,20 @@ class ActorsBridge(Base):
     """
     __tablename__ = "actors_bridge"
     # Define conditional relationships
-    movie = relationship("Movies", primaryjoin="ActorsBridge.movie_id == Movies.movie_id", uselist=False)
-    show = relationship("Shows", primaryjoin="ActorsBridge.show_id == Shows.show_id", uselist=False)
-    actor = relationship("Actors", primaryjoin="ActorsBridge.actor_id == Actors.actor_id", uselist=False)
+    movie = relationship("Movies", primaryjoin="ActorsBridge.movie_id == Movies.movie_id", uselist=False, lazy="raise")
+    show = relationship("Shows", primaryjoin="ActorsBridge.show_id == Shows.show_id", uselist=False, lazy="raise")
+    actor = relationship("Actors", primaryjoin="ActorsBridge.actor_id == Actors.actor_id", uselist=False, lazy="raise")
     __table_args__ = (
         ForeignKeyConstraint(['movie_id'], ['movies.movie_id'], name='fk_a_movie_id'),
         ForeignKeyConstraint(['show_id'], ['shows.show_id'], name='fk_a_show_id'),
-        ForeignKeyConstraint(['actor_id'], ['actors.actor_id'], name='fk_actor_id')
+        ForeignKeyConstraint(['actor_id'], ['actors.actor_id'], name='fk_actor_id'),
+        Index("ix_actors_bridge_actor_id_movie_id", "actor_id", "movie_id")
     )
     index = Column(Integer, primary_key=True, autoincrement=True)
-    movie_id = Column(String(128))
-    show_id = Column(String(128))
+    movie_id = Column(String(16), index=True)
+    show_id = Column(String(16), index=True)
     actor_id = Column(Integer, nullable=False)
 
-    def __init__(self, movie_id, show_id, actor_id):
-        """
-        Initializes a ActorsBridge instance.
-
-        Args:
-            movie_id (str): Unique identifier for the movie.
-            show_id (str): Unique identifier for the show.
-            actor_id (int): Foreign key for the actors table.
-        """
-        self.movie_id = movie_id
-        self.show_id = show_id
-        self.actor_id = actor_id
-
     def __repr__(self):
         """
         Provides a string representation of the ActorsBridge instance.
@@ -360,20 +316,11 @@ class Directors(Base):
     """
     __tablename__ = "directors"
 
-    index = Column(Integer, primary_key=True, unique=True, index=True, autoincrement=True)
-    director_id = Column(Integer, index=True)
+    index = Column(Integer, primary_key=True, autoincrement=True)
+    director_id = Column(Integer, unique=True)
     director = Column(String(512))
 
-    def __init__(self, director_id, director):
-        """
-        Initializes a Directors instance.
-
-        Args:
-            director_id (int): Unique identifier for the director.
-            director (str): Name of the director.
-        """
-        self.director_id = director_id
-        self.director = director
+    __table_args__ = full_text_indexes("directors_director", director)
 
     def __repr__(self):
         """
@@ -396,31 +343,18 @@ class DirectorsBridge(Base):
     """
     __tablename__ = "directors_bridge"
     # Define conditional relationships
-    movie = relationship("Movies", primaryjoin="DirectorsBridge.movie_id == Movies.movie_id", uselist=False)
-    show = relationship("Shows", primaryjoin="DirectorsBridge.show_id == Shows.show_id", uselist=False)
-    director = relationship("Directors", primaryjoin="DirectorsBridge.director_id == Directors.director_id", uselist=False)
+    movie = relationship("Movies", primaryjoin="DirectorsBridge.movie_id == Movies.movie_id", uselist=False, lazy="raise")
+    show = relationship("Shows", primaryjoin="DirectorsBridge.show_id == Shows.show_id", uselist=False, lazy="raise")
+    director = relationship("Directors", primaryjoin="DirectorsBridge.director_id == Directors.director_id", uselist=False, lazy="raise")
     __table_args__ = (
         ForeignKeyConstraint(['movie_id'], ['movies.movie_id'], name='fk_d_movie_id'),
         ForeignKeyConstraint(['show_id'], ['shows.show_id'], name='fk_d_show_id'),
         ForeignKeyConstraint(['director_id'], ['directors.director_id'], name='fk_director_id')
     )
     index = Column(Integer, primary_key=True, autoincrement=True)
-    movie_id = Column(String(128))
-    show_id = Column(String(128))
-    director_id = Column(Integer, nullable=False)
-
-    def __init__(self, movie_id, show_id, director_id):
-        """
-        Initializes a DirectorsBridge instance.
-
-        Args:
-            movie_id (str): Unique identifier for the movie.
-            show_id (str): Unique identifier for the show.
-            director_id (int): Foreign key for the actors table.
-        """
-        self.movie_id = movie_id
-        self.show_id = show_id
-        self.director_id = director_id
+    movie_id = Column(String(16), index=True)
+    show_id = Column(String(16), index=True)
+    director_id = Column(Integer, nullable=False, index=True)
 
     def __repr__(self):
         """
@@ -441,19 +375,10 @@ class Characters(Base):
     """
     __tablename__ = "characters"
     
-    character_id = Column(Integer, primary_key=True, unique=True, index=True)
+    character_id = Column(Integer, primary_key=True)
     character = Column(String(255))
 
-    def __init__(self, character_id, character):
-        """
-        Initializes a Characters instance.
-
-        Args:
-            character_id (int): Primary key for the characters table.
-            character (str): Name of the character.
-        """
-        self.character_id = character_id
-        self.character = character
+    __table_args__ = full_text_indexes("characters_character", character) + (trigram_index("characters_character", "character"),)
 
     def __repr__(self):
         """
@@ -477,36 +402,24 @@ class CharactersBridge(Base):
     """
     __tablename__ = "characters_bridge"
     # Define conditional relationships
-    movie = relationship("Movies", primaryjoin="CharactersBridge.movie_id == Movies.movie_id", uselist=False)
-    show = relationship("Shows", primaryjoin="CharactersBridge.show_id == Shows.show_id", uselist=False)
-    actor = relationship('Actors', primaryjoin="CharactersBridge.actor_id == Actors.actor_id", uselist=False)
-    character = relationship('Characters', primaryjoin="CharactersBridge.character_id == Characters.character_id", uselist=False)
+    movie = relationship("Movies", primaryjoin="CharactersBridge.movie_id == Movies.movie_id", uselist=False, lazy="raise")
+    show = relationship("Shows", primaryjoin="CharactersBridge.show_id == Shows.show_id", uselist=False, lazy="raise")
+    actor = relationship('Actors', primaryjoin="CharactersBridge.actor_id == Actors.actor_id", uselist=False, lazy="raise")
+    character = relationship('Characters', primaryjoin="CharactersBridge.character_id == Characters.character_id", uselist=False, lazy="raise")
     __table_args__ = (
         ForeignKeyConstraint(['movie_id'], ['movies.movie_id'], name='fk_c_movie_id'),
         ForeignKeyConstraint(['show_id'], ['shows.show_id'], name='fk_c_show_id'),
         ForeignKeyConstraint(['actor_id'], ['actors.actor_id'], name='fk_c_actor_id'),
-        ForeignKeyConstraint(['character_id'], ['characters.character_id'], name='fk_character_id')
+        ForeignKeyConstraint(['character_id'], ['characters.character_id'], name='fk_character_id'),
+        # The view joins characters on the title and the actor together
+        Index("ix_characters_bridge_movie_id_actor_id", "movie_id", "actor_id"),
+        Index("ix_characters_bridge_show_id_actor_id", "show_id", "actor_id")
     )
     index = Column(Integer, primary_key=True, autoincrement=True)
-    movie_id = Column(String(128))
-    show_id = Column(String(128))
+    movie_id = Column(String(16))
+    show_id = Column(String(16))
     actor_id = Column(Integer)
-    character_id = Column(Integer)
-
-    def __init__(self, movie_id, show_id, actor_id, character_id):
-        """
-        Initializes a CharactersBridge instance.
-
-        Args:
-            movie_id (str): Unique identifier for the movie.
-            show_id (str): Unique identifier for the show.
-            actor_id (int): Unique identifier for the actor.
-            character_id (int): Foreign key for the characters table.
-        """
-        self.movie_id = movie_id
-        self.show_id = show_id
-        self.actor_id = actor_id
-        self.character_id = character_id
+    character_id = Column(Integer, index=True)
 
     def __repr__(self):
         """
@@ -531,37 +444,22 @@ class IMDBInfo(Base):
     """
     __tablename__ = "imdb_info"
     # Define conditional relationships
-    movie = relationship("Movies", primaryjoin="IMDBInfo.movie_id == Movies.movie_id", uselist=False)
-    show = relationship("Shows", primaryjoin="IMDBInfo.show_id == Shows.show_id", uselist=False)
+    movie = relationship("Movies", primaryjoin="IMDBInfo.movie_id == Movies.movie_id", uselist=False, lazy="raise")
+    show = relationship("Shows", primaryjoin="IMDBInfo.show_id == Shows.show_id", uselist=False, lazy="raise")
     __table_args__ = (
         ForeignKeyConstraint(['movie_id'], ['movies.movie_id'], name='fk_imdb_movie_id'),
-        ForeignKeyConstraint(['show_id'], ['shows.show_id'], name='fk_imdb_show_id')
+        ForeignKeyConstraint(['show_id'], ['shows.show_id'], name='fk_imdb_show_id'),
+        # Lets ORDER BY imdb_score DESC ... LIMIT read the top rows straight off the index
+        Index("ix_imdb_info_score_desc", desc("imdb_score"), "movie_id"),
     )
-    index = Column(Integer, primary_key=True, unique=True, index=True, autoincrement=True)
-    movie_id = Column(String(128))
-    show_id = Column(String(128))
-    imdb_id = Column(String(128))
+    index = Column(Integer, primary_key=True, autoincrement=True)
+    movie_id = Column(String(16), index=True)
+    show_id = Column(String(16), index=True)
+    imdb_id = Column(String(16))
     imdb_score = Column(Float)
     imdb_votes = Column(Integer)
 
 
-    def __init__(self, movie_id, show_id, imdb_id, imdb_score, imdb_votes):
-        """
-        Initializes an IMDBInfo instance.
-
-        Args:
-            movie_id (str): Unique identifier for the movie.
-            show_id (str): Unique identifier for the show.
-            imdb_id (str): Unique identifier for the IMDB entry.
-            imdb_score (float): IMDB score.
-            imdb_votes (int): Number of votes on IMDB.
-        """
-        self.movie_id = movie_id
-        self.show_id = show_id
-        self.imdb_id = imdb_id
-        self.imdb_score = imdb_score
-        self.imdb_votes = imdb_votes
-
     def __repr__(self):
         """
         Provides a string representation of the IMDBInfo instance.
@@ -577,31 +475,18 @@ class Predictions(Base):
 
     Attributes:
         index (int): Unique identifier for the prediction record (auto-incrementing integer).
-        timestamp (datetime): Datetime when the prediction was made (automatically set to UTC on creation).
+        timestamp (datetime): Datetime when the prediction was made (set by the database on insert).
         user_id (str): User identifier associated with the prediction.
         prediction_value (float): The predicted value.
     """
 
     __tablename__ = "predictions"
 
-    index = Column(Integer, primary_key=True, unique=True, index=True, autoincrement=True)
-    timestamp = Column(DateTime, default=lambda: datetime.now(timezone(timedelta(hours=2))))
+    index = Column(Integer, primary_key=True, autoincrement=True)
+    timestamp = Column(DateTime, server_default=func.now(), nullable=False, index=True)
     user_id = Column(String(64), nullable=False)
     prediction_value = Column(Float, nullable=False)
 
-    def __init__(self, user_id, prediction_value):
-        """
-        Initializes a new prediction object.
-
-        Args:
-            user_id (str): The user identifier associated with the prediction.
-            prediction_value (float): The predicted value.
-        """
-
-        self.timestamp = datetime.now(timezone(timedelta(hours=2)))
-        self.user_id = user_id
-        self.prediction_value = prediction_value
-
     def __repr__(self):
         """
         Returns a string representation of the prediction object.
@@ -616,11 +501,13 @@ class Predictions(Base):
     
 class MoviesAndShowsView(Base):
     """
-    Represents the movies_and_shows_view view in the database.
+    Represents the movies_and_shows_mv table in the database, a materialized copy of the
+    movies_and_shows_view view that is rebuilt by the ETL pipeline and indexed for the media filters.
 
     Attributes:
+        row_id (int): Primary key for the table, used as the pagination cursor.
         media_type (str): Type of media, either 'movie' or 'show'.
-        index (int): Primary key for the view.
+        index (int): Index of the movie or show in its own table.
         movie_id (str): Unique identifier for the movie.
         show_id (str): Unique identifier for the show.
         title (str): Title of the media.
@@ -636,63 +523,40 @@ class MoviesAndShowsView(Base):
         imdb_score (float): IMDB score.
         imdb_votes (int): Number of votes on IMDB.
     """
-    __tablename__ = "movies_and_shows_view"
-    media_type = Column(String, primary_key=True)
-    index = Column(Integer, primary_key=True)
-    movie_id = Column(String(128), nullable=True)
-    show_id = Column(String(128), nullable=True)
-    title = Column(String(256))
-    release_year = Column(Integer)
-    age_certification = Column(String(10))
+    __tablename__ = "movies_and_shows_mv"
+    row_id = Column(Integer, primary_key=True, autoincrement=True)
+    media_type = Column(String(8))
+    index = Column(Integer)
+    movie_id = Column(String(16), nullable=True)
+    show_id = Column(String(16), nullable=True)
+    title = Column(String(512))
+    release_year = Column(Integer, index=True)
+    age_certification = Column(String(16), index=True)
     runtime = Column(Integer)
     seasons = Column(Integer, nullable=True)
-    genre = Column(String(128))
-    country = Column(String(128))
-    director = Column(String(128))
-    actor = Column(String(128))
-    character = Column(String(128))
+    genre = Column(String(255))
+    country = Column(String(255))
+    director = Column(String(512))
+    actor = Column(String(512))
+    character = Column(String(255))
     imdb_score = Column(Float)
     imdb_votes = Column(Integer)
-    
-    def __init__(self, media_type, index, movie_id, show_id, title, release_year, age_certification, runtime, seasons, genre, country, director, actor, character, imdb_score, imdb_votes):
-        """
-        Initializes a MoviesAndShowsView instance.
-
-        Args:
-            media_type (str): Type of media, either 'movie' or 'show'.
-            index (int): Primary key for the view.
-            movie_id (str): Unique identifier for the movie.
-            show_id (str): Unique identifier for the show.
-            title (str): Title of the media.
-            release_year (int): Year of release.
-            age_certification (str): Age certification.
-            runtime (int): Runtime in minutes.
-            seasons (int): Number of seasons (for shows).
-            genre (str): Genre of the media.
-            country (str): Country of production.
-            director (str): Director of the media.
-            actor (str): Actor in the media.
-            character (str): Character played by the actor.
-            imdb_score (float): IMDB score.
-            imdb_votes (int): Number of votes on IMDB.
-        """
-        self.media_type = media_type
-        self.index = index
-        self.movie_id = movie_id
-        self.show_id = show_id
-        self.title = title
-        self.release_year = release_year
-        self.age_certification = age_certification
-        self.runtime = runtime
-        self.seasons = seasons
-        self.genre = genre
-        self.country = country
-        self.director = director
-        self.actor = actor
-        self.character = character
-        self.imdb_score = imdb_score
-        self.imdb_votes = imdb_votes
 
+    __table_args__ = (
+        Index("ix_movies_and_shows_mv_media_type_row_id", media_type, row_id),
+        # Serves the imdb_score and imdb_votes range filters of the media endpoint together
+        Index("ix_movies_and_shows_mv_imdb_score_votes", imdb_score.desc(), imdb_votes.desc()),
+        *full_text_indexes("movies_and_shows_mv_title", title),
+        *full_text_indexes("movies_and_shows_mv_genre", genre),
+        *full_text_indexes("movies_and_shows_mv_director", director),
+        *full_text_indexes("movies_and_shows_mv_actor", actor),
+        *full_text_indexes("movies_and_shows_mv_character", character),
+        trigram_index("movies_and_shows_mv_title", "title"),
+        trigram_index("movies_and_shows_mv_director", "director"),
+        trigram_index("movies_and_shows_mv_actor", "actor"),
+        trigram_index("movies_and_shows_mv_character", "character")
+    )
+    
     def __repr__(self):
         """
         Provides a string representation of the MoviesAndShowsView instance.
@@ -1,7 +1,22 @@
-from typing import Optional
+from typing import Generic, List, Optional, TypeVar
 from pydantic import BaseModel
 from datetime import datetime
 
+T = TypeVar("T")
+
+class Page(BaseModel, Generic[T]):
+    """
+    Generic envelope for keyset-paginated list responses.
+
+    Attributes:
+    - items (List[T]): Records on the current page.
+    - has_more (bool): Whether another page follows, so clients never need a total count.
+    - next_cursor (int, optional): Value to pass as `cursor` to fetch the next page, None on the last page.
+    """
+    items: List[T]
+    has_more: bool = False
+    next_cursor: Optional[int] = None
+
 class MovieBase(BaseModel):
     """
     Base model for Movie objects.
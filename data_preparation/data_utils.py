@@ -1,16 +1,110 @@
 import logging
+from io import BytesIO
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
 from sqlalchemy import exc
 
-def data_to_sql(df, table_name, engine):
+logger = logging.getLogger(__name__)
+
+def copy_to_postgres(df, table, connection):
+    """
+    Load a DataFrame into a PostgreSQL table with a single COPY ... FROM STDIN.
+
+    The frame, index included as to_sql would write it, is converted to an Arrow table and serialized
+    to CSV by Arrow's writer in one pass over its column buffers, without building a Python tuple per row.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame containing data to be inserted.
+    table (sqlalchemy.Table): The table to insert into.
+    connection (sqlalchemy.engine.Connection): Connection the rows are written through.
+    """
+    frame = df.reset_index()
+    buffer = BytesIO()
+    pacsv.write_csv(pa.Table.from_pandas(frame, preserve_index=False), buffer, pacsv.WriteOptions(include_header=False))
+    buffer.seek(0)
+
+    columns = ', '.join(f'"{column}"' for column in frame.columns)
+    with connection.connection.cursor() as cursor:
+        cursor.copy_expert(f'COPY "{table.name}" ({columns}) FROM STDIN WITH CSV', buffer)
+
+def to_records(df):
+    """
+    Convert a DataFrame, index included, into the list of parameter dicts of an executemany INSERT.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame to convert.
+
+    Returns:
+    list: One dict per row, keyed by column name, with missing values as None.
+    """
+    frame = df.reset_index().astype(object)
+    return frame.where(frame.notna(), None).to_dict(orient='records')
+
+def data_to_sql(df, table, engine, chunksize=10000):
     """
     Insert DataFrame into an SQL table using SQLAlchemy.
 
+    All rows are written in one transaction: with a single COPY on PostgreSQL, and elsewhere with a Core
+    INSERT of the table executed for batches of `chunksize` rows, which the driver runs as an executemany
+    (PyMySQL rewrites it into multi-row INSERT statements).
+
     Parameters:
     df (pd.DataFrame): The DataFrame containing data to be inserted.
-    table_name (str): Name of the SQL table to insert into.
+    table (sqlalchemy.Table): The table to insert into, from the models' metadata.
     engine (sqlalchemy.engine.Engine): SQLAlchemy engine instance connected to the database.
+    chunksize (int): Number of rows written per executemany.
 
     Logs any SQLAlchemyError encountered during insertion to 'data_error.log'.
     """
-    df.to_sql(table_name, engine, if_exists='append')
-    print(f"{df} data inserted successfully.")
+    with engine.begin() as connection:
+        if engine.dialect.name == 'postgresql':
+            copy_to_postgres(df, table, connection)
+        else:
+            insert = table.insert()
+            for start in range(0, len(df), chunksize):
+                connection.execute(insert, to_records(df.iloc[start:start + chunksize]))
+    logger.info("%d rows inserted into %s", len(df), table.name)
+
+def split_title_id(df, column='id'):
+    """
+    Split a title id column into movie_id and show_id columns.
+
+    Movie ids start with 'tm' and show ids with 'ts', so a single pass over the second character
+    classifies every id; the other column is left empty.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame holding the title ids.
+    column (str): Name of the title id column, dropped from the result.
+
+    Returns:
+    pd.DataFrame: A new DataFrame with movie_id and show_id in place of the title id column.
+    """
+    kind = df[column].str.get(1)
+    return df.assign(movie_id=df[column].where(kind == 'm'), show_id=df[column].where(kind == 's')).drop(columns=[column])
+
+def index_from_one(df, name=None):
+    """
+    Number the rows of a DataFrame from 1, the way the tables' index primary keys are numbered.
+
+    Parameters:
+    df (pd.DataFrame): The DataFrame to renumber.
+    name (str, optional): Name given to the new index.
+
+    Returns:
+    pd.DataFrame: The DataFrame with a 1-based RangeIndex.
+    """
+    return df.set_axis(pd.RangeIndex(1, len(df) + 1, name=name))
+
+def split_by(dataset, column):
+    """
+    Split a dataset into sub-frames by the values of one column, in a single grouping pass.
+
+    Parameters:
+    dataset (pd.DataFrame): The DataFrame to split.
+    column (str): Name of the column to split on, e.g. 'type' of the titles or 'role' of the credits.
+
+    Returns:
+    dict: The rows of each value present in the column, keyed by that value.
+    """
+    return dict(tuple(dataset.groupby(column, sort=False, observed=True)))
@@ -1,9 +1,17 @@
-from sqlalchemy import text
+from sqlalchemy import column, delete, insert, select, table, text
+from database_models import MoviesAndShowsView
 
 def create_view(engine):
-    with engine.connect() as connection:
+    """
+    Creates the movies_and_shows_view view, replacing it when the pipeline is run again, so
+    refresh_view always follows and the materialized copy never stays stale.
+
+    Parameters:
+    engine (sqlalchemy.engine.Engine): SQLAlchemy engine instance connected to the database.
+    """
+    with engine.begin() as connection:
         sql = text("""
-        CREATE VIEW movies_and_shows_view AS
+        CREATE OR REPLACE VIEW movies_and_shows_view AS
         SELECT 
             'movie' AS media_type,
             m.index,
@@ -64,4 +72,22 @@ def create_view(engine):
         LEFT JOIN characters c ON cb.character_id = c.character_id
         LEFT JOIN imdb_info i ON s.show_id = i.show_id
         """)
-        connection.execute(sql)
\ No newline at end of file
+        connection.execute(sql)
+
+def refresh_view(engine):
+    """
+    Rebuilds the movies_and_shows_mv table from the movies_and_shows_view view.
+
+    The API reads the materialized, indexed copy instead of re-running the view's joins on
+    every request. The rebuild runs in one transaction, so readers never see a partly filled table.
+
+    Parameters:
+    engine (sqlalchemy.engine.Engine): SQLAlchemy engine instance connected to the database.
+    """
+    materialized = MoviesAndShowsView.__table__
+    columns = [c.name for c in materialized.columns if c.name != 'row_id']
+    view = table('movies_and_shows_view', *[column(name) for name in columns])
+
+    with engine.begin() as connection:
+        connection.execute(delete(materialized))
+        connection.execute(insert(materialized).from_select(columns, select(*view.columns)))
@@ -1,4 +1,5 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from decouple import config
 from sqlalchemy import create_engine, exc
 from sqlalchemy_utils import database_exists, create_database
@@ -6,23 +7,29 @@ import logging
 # Importing data transformation functions from separate modules
 from data_transformations import (
     transform_movies, transform_shows, transform_genres, transform_production_countries,
-    transform_actors, transform_directors, transform_characters, transform_imdb_info
+    transform_actors, transform_directors, transform_characters, transform_imdb_info, TITLE_COLUMNS
 )
 from database_models import Base
-from data_utils import data_to_sql
-from data_view import create_view
+from data_utils import data_to_sql, split_by
+from data_view import create_view, refresh_view
 
 if __name__ == "__main__":
     # Set up logging
     logging.basicConfig(filename='data_log.log', level=logging.INFO)
+    engine = None
 
     try:
         # Load environment variables
         CONNECTION_STRING = config('CONNECTION_STRING')
         logging.info("Loaded environment variables.")
 
-        # Create a database engine
-        engine = create_engine(CONNECTION_STRING)
+        # Create a database engine whose pool holds a connection for every table of an insert wave,
+        # pinging pooled connections before reuse so one dropped during the transforms is replaced
+        engine = create_engine(
+            CONNECTION_STRING,
+            pool_size=config('DB_POOL_SIZE', default=10, cast=int),
+            pool_pre_ping=True
+        )
         logging.info("Created database engine.")
 
         # If the database doesn't exist, create it
@@ -32,14 +39,30 @@ if __name__ == "__main__":
         else:
             logging.info("Database already exists.")
 
-        # Load CSV data into pandas DataFrames
-        titles = pd.read_csv('../datasets/raw_titles.csv')
+        # Load CSV data into pandas DataFrames with pyarrow's multithreaded parser, skipping the CSVs' unused 'index'
+        # column. Title types and credit roles are read as categoricals so the transforms filter them by comparing
+        # small integer codes, and the other text columns as Arrow strings, which take about a third of the memory
+        # of Python strings
+        titles = pd.read_csv('../datasets/raw_titles.csv', engine='pyarrow', usecols=[
+            'id', 'title', 'type', 'release_year', 'age_certification', 'runtime', 'genres', 'production_countries',
+            'seasons', 'imdb_id', 'imdb_score', 'imdb_votes',
+        ], dtype={
+            'type': 'category',
+            **dict.fromkeys(['id', 'title', 'age_certification', 'genres', 'production_countries', 'imdb_id'], 'string[pyarrow]'),
+        })
         logging.info("Loaded titles dataset.")
-        print("Titles dataset sample: \n", titles.head(3))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Titles dataset sample: \n%s", titles.head(3))
 
-        credits = pd.read_csv('../datasets/raw_credits.csv')
+        credits = pd.read_csv('../datasets/raw_credits.csv', engine='pyarrow', usecols=[
+            'person_id', 'id', 'name', 'character', 'role',
+        ], dtype={
+            'role': 'category',
+            **dict.fromkeys(['id', 'name', 'character'], 'string[pyarrow]'),
+        })
         logging.info("Loaded credits dataset.")
-        print("Credits dataset sample: \n", credits.head(3))
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Credits dataset sample: \n%s", credits.head(3))
 
         # Enable copy-on-write mode to avoid modifying original DataFrames
         pd.options.mode.copy_on_write = True
@@ -48,51 +71,68 @@ if __name__ == "__main__":
         Base.metadata.create_all(engine)
         logging.info("Created database tables based on schema.")
 
-        # Transform data and insert it into the respective tables
-        movies = transform_movies(titles)
-        shows = transform_shows(titles)
+        # Split titles by type and credits by role once, then transform data and insert it into the respective tables.
+        # Only the title columns are split by type, the list and IMDB columns are read by their own transforms
+        titles_by_type = split_by(titles[TITLE_COLUMNS], 'type')
+        credits_by_role = split_by(credits, 'role')
+
+        movies = transform_movies(titles_by_type['MOVIE'])
+        shows = transform_shows(titles_by_type['SHOW'])
         genres, genres_bridge = transform_genres(titles)
         production_countries, production_countries_bridge = transform_production_countries(titles)
-        actors, actors_bridge = transform_actors(credits)
-        directors, directors_bridge = transform_directors(credits)
-        characters, characters_bridge = transform_characters(credits)
+        actors, actors_bridge = transform_actors(credits_by_role['ACTOR'])
+        directors, directors_bridge = transform_directors(credits_by_role['DIRECTOR'])
+        characters, characters_bridge = transform_characters(credits_by_role['ACTOR'])
         imdb_info = transform_imdb_info(titles)
         logging.info("Transformed data.")
 
-        # List of dataframes and their corresponding table names for insertion
-        data_table_pairs = [
-            (movies, 'movies'),
-            (shows, 'shows'),
-            (genres, 'genres'),
-            (genres_bridge, 'genres_bridge'),
-            (production_countries, 'production_countries'),
-            (production_countries_bridge, 'production_countries_bridge'),
-            (actors, 'actors'),
-            (actors_bridge, 'actors_bridge'),
-            (directors, 'directors'),
-            (directors_bridge, 'directors_bridge'),
-            (characters, 'characters'),
-            (characters_bridge, 'characters_bridge'),
-            (imdb_info, 'imdb_info')
+        # Dataframes and their corresponding table names for insertion, in two waves: the tables
+        # referenced by foreign keys first, then the bridges and imdb_info that reference them
+        data_table_waves = [
+            [
+                (movies, 'movies'),
+                (shows, 'shows'),
+                (genres, 'genres'),
+                (production_countries, 'production_countries'),
+                (actors, 'actors'),
+                (directors, 'directors'),
+                (characters, 'characters'),
+            ],
+            [
+                (genres_bridge, 'genres_bridge'),
+                (production_countries_bridge, 'production_countries_bridge'),
+                (actors_bridge, 'actors_bridge'),
+                (directors_bridge, 'directors_bridge'),
+                (characters_bridge, 'characters_bridge'),
+                (imdb_info, 'imdb_info'),
+            ],
         ]
 
-        # Loop through each pair and call data_to_sql function for data insertion
-        for data, table in data_table_pairs:
-            try:
-                data_to_sql(data, table, engine)
-                logging.info(f"Inserted data into {table} table.")
-            except exc.SQLAlchemyError as e:
-                logging.error(f"Error inserting data into {table} table: {e}")
+        # Tables within a wave are independent, so each is inserted on its own pooled connection concurrently,
+        # through Core inserts of the tables defined in the models' metadata
+        tables = Base.metadata.tables
+        for data_table_pairs in data_table_waves:
+            with ThreadPoolExecutor(max_workers=len(data_table_pairs)) as executor:
+                insertions = [(table, executor.submit(data_to_sql, data, tables[table], engine)) for data, table in data_table_pairs]
+                for table, insertion in insertions:
+                    try:
+                        insertion.result()
+                        logging.info(f"Inserted data into {table} table.")
+                    except exc.SQLAlchemyError as e:
+                        logging.error(f"Error inserting data into {table} table: {e}")
 
         create_view(engine)
-        logging.info("View 'movies_and_shows_view' created successfully.")
+        logging.info("View 'movies_and_shows_view' created or replaced successfully.")
 
-        # Close the connection and dispose of all associated resources
-        engine.dispose()
-        logging.info("Database connection closed and resources disposed.")
+        refresh_view(engine)
+        logging.info("Materialized 'movies_and_shows_view' into 'movies_and_shows_mv'.")
 
     except Exception as e:
         logging.error(f"An error occurred: {e}")
 
     finally:
+        # Close the connections and dispose of all associated resources, also when a step failed
+        if engine is not None:
+            engine.dispose()
+            logging.info("Database connection closed and resources disposed.")
         logging.shutdown()  # Ensure all buffered logs are flushed to disk
\ No newline at end of file
@@ -1,14 +1,29 @@
+import logging
 import os
+import time
 from kaggle.api.kaggle_api_extended import KaggleApi
 
-api = KaggleApi()
-api.authenticate()
+logger = logging.getLogger(__name__)
+
+# Show the INFO notices when the script is run directly
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
 
 # Specify the dataset you want to download
 dataset = 'thedevastator/the-ultimate-netflix-tv-shows-and-movies-dataset'
 
-# Create a directory to store the dataset
-os.makedirs('../datasets', exist_ok=True)
+# Raw files read by the ETL pipeline, downloaded again only once they are older than a day
+dataset_files = ['../datasets/raw_titles.csv', '../datasets/raw_credits.csv']
+CACHE_TTL = 24 * 60 * 60
+
+if all(os.path.exists(path) and time.time() - os.path.getmtime(path) < CACHE_TTL for path in dataset_files):
+    logger.info("Dataset files are up to date, skipping download.")
+else:
+    api = KaggleApi()
+    api.authenticate()
+
+    # Create a directory to store the dataset
+    os.makedirs('../datasets', exist_ok=True)
 
-# Download and unzip the dataset
-api.dataset_download_files(dataset, path='../datasets', unzip=True)
\ No newline at end of file
+    # Download and unzip the dataset
+    api.dataset_download_files(dataset, path='../datasets', unzip=True)